@@ -8,15 +8,15 @@ https://github.com/Limych/ha-gismeteo/
 """
 
 from collections.abc import Callable
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 import logging
 import math
 from typing import Any
-import xml.etree.ElementTree as etree  # type: ignore
 
 from aiohttp import ClientSession
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from homeassistant.components.weather import (
     ATTR_CONDITION_CLEAR_NIGHT,
@@ -79,6 +79,11 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_XML_PARSER = etree.XMLParser(resolve_entities=False, remove_blank_text=True)
+_XPATH_DAYS = etree.XPath("location/day")
+_XPATH_DAYS_DESCR = etree.XPath("location/day[@descr]")
+_XPATH_FORECASTS = etree.XPath("forecast")
+
 
 class InvalidCoordinatesError(Exception):
     """Raised when coordinates are invalid."""
@@ -190,6 +195,9 @@ class GismeteoApiClient:
                 forecast = [data]
             else:
                 forecast.append(data)
+                # Entries are chronological, so the rest can't shift the result
+                if len(forecast) > pos:
+                    break
 
         try:
             return forecast[pos]
@@ -244,7 +252,7 @@ class GismeteoApiClient:
 
         response = await self._async_get_data(url, cache_fname)
         try:
-            xml = etree.fromstring(response)
+            xml = self._parse_xml(response)
             item = xml.find("item")
             self._attributes = {
                 ATTR_ID: self._get(item, "id", int),
@@ -273,7 +281,7 @@ class GismeteoApiClient:
     async def async_get_parsed(self) -> dict[str, Any]:
         """Retrieve data from Gismeteo main site."""
         forecast = await self.async_get_forecast()
-        location = etree.fromstring(forecast).find("location")
+        location = self._parse_xml(forecast).find("location")
         location_uri = str(location.get("nowcast_url")).strip("/")[8:]
         tzone = int(location.get("tzone"))
         today = self._get_utime(location.get("cur_time")[:10], tzone)
@@ -303,6 +311,16 @@ class GismeteoApiClient:
         except AttributeError:  # pragma: no cover
             return {}
 
+    @staticmethod
+    def _parse_xml(data: str | bytes) -> etree._Element:
+        """Parse XML document.
+
+        :raise etree.ParseError
+        """
+        if not isinstance(data, bytes):
+            data = data.encode()
+        return etree.fromstring(data, _XML_PARSER)
+
     @staticmethod
     def _get(var: dict, k: str, func: Callable | None = None) -> StateType:
         res = var.get(k)
@@ -615,12 +633,9 @@ class GismeteoApiClient:
 
         :raise ValueError
         """
-        local_date = source
-        if len(source) <= 10:
-            local_date += "T00:00:00"
-        tz_h, tz_m = divmod(abs(tzone), 60)
-        local_date += f"+{tz_h:02}:{tz_m:02}" if tzone >= 0 else f"-{tz_h:02}:{tz_m:02}"
-        return dt_util.parse_datetime(local_date, raise_on_error=True)
+        return datetime.fromisoformat(source).replace(
+            tzinfo=timezone(timedelta(minutes=tzone))
+        )
 
     @Throttle(PARSED_UPDATE_INTERVAL)
     async def async_update_parsed(self) -> None:
@@ -634,7 +649,7 @@ class GismeteoApiClient:
         """
         response = await self.async_get_forecast()
         try:
-            xml = etree.fromstring(response)
+            xml = self._parse_xml(response)
             current = xml.find("location/fact")
             current_v = current.find("values")
             tzone = int(xml.find("location").get("tzone"))
@@ -669,7 +684,7 @@ class GismeteoApiClient:
 
             # Update hourly forecast
             self._forecast_hourly = []
-            for day in xml.findall("location/day"):
+            for day in _XPATH_DAYS(xml):
                 sunrise = datetime.fromtimestamp(
                     self._get(day, "sunrise", int), today.tzinfo
                 )
@@ -677,7 +692,7 @@ class GismeteoApiClient:
                     self._get(day, "sunset", int), today.tzinfo
                 )
 
-                for i in day.findall("forecast"):
+                for i in _XPATH_FORECASTS(day):
                     fc_v = i.find("values")
                     tstamp = self._get_utime(i.get("valid"), tzone)
                     tstamp_day = self._get_utime(i.get("valid")[:10], tzone)
@@ -734,7 +749,7 @@ class GismeteoApiClient:
 
             # Update daily forecast
             self._forecast_daily = []
-            for day in xml.findall("location/day[@descr]"):
+            for day in _XPATH_DAYS_DESCR(xml):
                 tstamp = self._get_utime(day.get("date"), tzone)
                 data = {
                     ATTR_SUNRISE: sunrise,